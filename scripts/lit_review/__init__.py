@@ -0,0 +1,112 @@
+"""
+lit_review — Genomics Paper Collector library
+=============================================
+Importable core of ``fetch_papers.py``: generator sources, a pluggable
+source registry, and composable filter/download stages over streams of
+typed :class:`Paper` records.
+
+    from lit_review import install_deps, load_config, iter_sources, \\
+        exclude_non_research, match_genomics, download_pdfs
+
+    install_deps()
+    cfg = load_config()
+    papers = match_genomics(exclude_non_research(iter_sources(cfg, logger), logger),
+                            cfg["genomics_keywords"])
+"""
+
+from .backfill import make_partitions, run_backfill
+from .config import load_config
+from .deps import install_deps
+from .download import (
+    download_pdf,
+    download_pdfs,
+    skip_pdfs,
+    try_core_pdf,
+    try_europepmc_pdf,
+    try_paperscraper_pdf,
+    try_semantic_scholar_pdf,
+)
+from .filters import (
+    compile_exclusion_rules,
+    exclude_non_research,
+    filter_genomics,
+    filter_non_research_articles,
+    match_genomics,
+)
+from .instrument import AttemptReport, add_hook, attempt, remove_hook
+from .pipeline import pdf_report, run, run_doi_mode, write_manifest
+from .records import (
+    Attempt,
+    Paper,
+    dumps_jsonl,
+    loads_jsonl,
+    paper_to_dict,
+    read_papers_jsonl,
+    write_papers_jsonl,
+)
+from .ratelimit import throttle
+from .sources import (
+    SOURCES,
+    fetch_biorxiv,
+    fetch_journal_feeds,
+    fetch_paper_by_doi,
+    get_source,
+    is_partitioned,
+    iter_biorxiv,
+    iter_dois,
+    iter_journal_feeds,
+    iter_sources,
+    register_source,
+)
+from .store import PaperStore, store_path
+from .watch import poll_once, run_watch
+
+__all__ = [
+    "Attempt",
+    "AttemptReport",
+    "Paper",
+    "PaperStore",
+    "SOURCES",
+    "add_hook",
+    "attempt",
+    "compile_exclusion_rules",
+    "download_pdf",
+    "download_pdfs",
+    "dumps_jsonl",
+    "exclude_non_research",
+    "fetch_biorxiv",
+    "fetch_journal_feeds",
+    "fetch_paper_by_doi",
+    "filter_genomics",
+    "filter_non_research_articles",
+    "get_source",
+    "install_deps",
+    "is_partitioned",
+    "iter_biorxiv",
+    "iter_dois",
+    "iter_journal_feeds",
+    "iter_sources",
+    "load_config",
+    "loads_jsonl",
+    "make_partitions",
+    "match_genomics",
+    "paper_to_dict",
+    "pdf_report",
+    "poll_once",
+    "read_papers_jsonl",
+    "register_source",
+    "remove_hook",
+    "run",
+    "run_backfill",
+    "run_doi_mode",
+    "run_watch",
+    "skip_pdfs",
+    "store_path",
+    "throttle",
+    "try_core_pdf",
+    "try_europepmc_pdf",
+    "try_paperscraper_pdf",
+    "try_semantic_scholar_pdf",
+    "write_manifest",
+    "write_papers_jsonl",
+]
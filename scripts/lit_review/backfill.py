@@ -0,0 +1,247 @@
+"""
+Backfill mode
+=============
+Fetches a long range (e.g. 90 days after a holiday) as date partitions
+instead of one wide window:
+
+* partitioned sources (bioRxiv) are fetched per partition in parallel,
+  sharing the process-wide per-host rate limits in :mod:`.ratelimit`;
+* other sources (RSS feeds, which only carry recent items) are fetched once
+  and their papers routed to the partition matching their date;
+* filtered papers are streamed straight into ``store/backfill/<start>_<end>.jsonl``
+  rather than held in lists; only the set of uids used for deduplication
+  grows with the range (one short string per paper);
+* the top ``max_papers_to_evaluate`` papers across all partitions (most
+  matched keywords, then newest) are picked with a bounded heap, get PDFs,
+  and form the merged ``manifest.json``; each partition also gets its own
+  manifest under ``partitions/``.
+
+Every partition is reported with a ``status``: ``complete``, ``partial``
+(a request failed and the source stopped early, see ``fetch_errors``) or
+``failed`` (a fetch task raised), plus the error messages.
+"""
+
+import heapq
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .download import download_pdfs, skip_pdfs
+from .filters import exclude_non_research, match_genomics
+from .instrument import AttemptReport
+from .pipeline import _prepare_dirs, setup_logging, write_manifest
+from .records import Paper, dumps_jsonl, rank_key, read_papers_jsonl
+from .sources import is_partitioned, iter_sources
+from .store import store_path
+
+Partition = tuple[str, str]
+
+
+def make_partitions(days: int, partition_days: int, today: Optional[date] = None) -> list[Partition]:
+    """Split the last ``days`` days (ending today) into inclusive ``(start, end)`` windows."""
+    if days < 1:
+        raise ValueError(f"Backfill range must be at least 1 day (days_lookback / --days), got {days}")
+    if partition_days < 1:
+        raise ValueError(
+            f"Backfill partitions must be at least 1 day "
+            f"(backfill_partition_days / --partition-days), got {partition_days}"
+        )
+    end = today or datetime.now().date()
+    cur = end - timedelta(days=days - 1)
+    partitions = []
+    while cur <= end:
+        stop = min(cur + timedelta(days=partition_days - 1), end)
+        partitions.append((cur.isoformat(), stop.isoformat()))
+        cur = stop + timedelta(days=1)
+    return partitions
+
+
+class _PartitionWriter:
+    """Thread-safe, deduplicating append of papers to per-partition JSONL files.
+
+    Deduplication keeps every uid written so far in memory (bounded by the
+    number of papers in the range, not their size).
+    """
+
+    def __init__(self, root: Path, partitions: list[Partition]):
+        root.mkdir(parents=True, exist_ok=True)
+        self.partitions = partitions
+        self.paths = {p: root / f"{p[0]}_{p[1]}.jsonl" for p in partitions}
+        for path in self.paths.values():
+            path.write_bytes(b"")
+        self.counts = Counter()
+        self._locks = {p: threading.Lock() for p in partitions}
+        self._seen = set()
+        self._seen_lock = threading.Lock()
+
+    def partition_for(self, paper: Paper) -> Partition:
+        day = paper.date[:10]
+        for p in self.partitions:
+            if p[0] <= day <= p[1]:
+                return p
+        # Undated or out-of-range entries go with the most recent partition
+        return self.partitions[-1]
+
+    def write(self, paper: Paper, partition: Optional[Partition] = None):
+        with self._seen_lock:
+            if paper.uid in self._seen:
+                return
+            self._seen.add(paper.uid)
+        partition = partition or self.partition_for(paper)
+        with self._locks[partition]:
+            with open(self.paths[partition], "ab") as f:
+                f.writelines(dumps_jsonl([paper]))
+            self.counts[partition] += 1
+
+    def iter_all(self) -> Iterator[Paper]:
+        for p in self.partitions:
+            yield from read_papers_jsonl(self.paths[p])
+
+
+def _fetch_into(cfg: dict, name: str, writer: _PartitionWriter, logger: logging.Logger,
+                partition: Optional[Partition] = None) -> int:
+    """Fetch one source (into one partition, or routed by date); ``cfg["fetch_errors"]`` collects failures."""
+    stream = iter_sources(cfg, logger, names=[name])
+    stream = exclude_non_research(stream, logger, cfg.get("exclusion_rules"))
+    stream = match_genomics(stream, cfg["genomics_keywords"])
+    count = 0
+    for paper in stream:
+        writer.write(paper, partition)
+        count += 1
+    return count
+
+
+def run_backfill(cfg: dict):
+    """Fetch ``days_lookback`` days as parallel date partitions into the paper store."""
+    days = cfg["days_lookback"]
+    # Validate before touching the filesystem; raises ValueError on bad sizes
+    partitions = make_partitions(days, cfg.get("backfill_partition_days", 7))
+    logger = setup_logging("fetch-papers-backfill")
+    output_dir, pdf_dir = _prepare_dirs(cfg)
+    workers = cfg.get("backfill_workers", 4)
+    writer = _PartitionWriter(store_path(cfg) / "backfill", partitions)
+    fetch_cfg = {**cfg, "max_papers_per_source": cfg.get("backfill_max_papers_per_source", 500)}
+
+    logger.info("=" * 60)
+    logger.info("BACKFILL — Genomics Paper Collector")
+    logger.info(f"  {days} days in {len(partitions)} partitions, {workers} workers")
+    logger.info("=" * 60)
+
+    # Step 1: Fetch + filter every partition in parallel, streaming to the store
+    logger.info("\nStep 1: Fetching partitions...")
+    status = {p: {"status": "complete", "errors": []} for p in partitions}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # future -> (label, partitions it feeds, that task's fetch_errors list)
+        futures = {}
+        for name in cfg.get("sources", ["biorxiv", "journal_feeds"]):
+            if is_partitioned(name):
+                for start, end in partitions:
+                    errors = []
+                    part_cfg = {**fetch_cfg, "start_date": start, "end_date": end, "fetch_errors": errors}
+                    future = pool.submit(_fetch_into, part_cfg, name, writer, logger, (start, end))
+                    futures[future] = (f"{name} {start}..{end}", [(start, end)], errors)
+            else:
+                # Fetched over the partitions' exact range (RSS would otherwise
+                # use now - days, a day earlier) and routed by date, so a
+                # failure here affects every partition
+                errors = []
+                range_cfg = {
+                    **fetch_cfg,
+                    "start_date": partitions[0][0],
+                    "end_date": partitions[-1][1],
+                    "fetch_errors": errors,
+                }
+                future = pool.submit(_fetch_into, range_cfg, name, writer, logger)
+                futures[future] = (name, partitions, errors)
+        for future in as_completed(futures):
+            label, affected, errors = futures[future]
+            try:
+                logger.info(f"  Done: {label} ({future.result()} papers)")
+                outcome = "partial" if errors else "complete"
+            except Exception as e:
+                logger.warning(f"  Failed: {label}: {e}")
+                errors.append(f"{label}: {e}")
+                outcome = "failed"
+            for p in affected:
+                status[p]["errors"].extend(errors)
+                if outcome == "failed" or (outcome == "partial" and status[p]["status"] == "complete"):
+                    status[p]["status"] = outcome
+
+    total = sum(writer.counts.values())
+    logger.info(f"  {total} genomics papers across {len(partitions)} partitions")
+    incomplete = [p for p in partitions if status[p]["status"] != "complete"]
+    for start, end in incomplete:
+        logger.warning(
+            f"  Partition {start}..{end} is {status[(start, end)]['status']}: "
+            f"{len(status[(start, end)]['errors'])} error(s); see the manifest"
+        )
+
+    # Step 2: Rank across partitions with a bounded heap
+    max_eval = cfg.get("max_papers_to_evaluate", 30)
+    logger.info(f"\nStep 2: Ranking top {max_eval} papers...")
+    top = heapq.nlargest(max_eval, writer.iter_all(), key=rank_key)
+
+    # Step 3: Download PDFs for the ranked papers only
+    if cfg.get("download_pdfs", True):
+        logger.info("\nStep 3: Downloading PDFs...")
+        for _ in download_pdfs(top, pdf_dir, cfg.get("pdf_timeout", 30), logger, total=len(top)):
+            pass
+        logger.info(f"  Downloaded {sum(1 for p in top if p.pdf_path)}/{len(top)} PDFs")
+    else:
+        logger.info("\nStep 3: Skipping PDF download (--no-pdf)")
+        for _ in skip_pdfs(top):
+            pass
+    report = AttemptReport.from_papers(top)
+    report.log(logger)
+
+    # Step 4: One manifest per partition, plus the merged ranked one
+    logger.info("\nStep 4: Writing manifests...")
+    compact = cfg.get("manifest_jsonl", False)
+    downloaded = {p.uid: p for p in top}
+    partition_dir = output_dir / "partitions"
+    for start, end in partitions:
+        papers = [downloaded.get(p.uid, p) for p in read_papers_jsonl(writer.paths[(start, end)])]
+        for p in papers:
+            if not p.review_mode:
+                p.review_mode = "abstract"
+        part_out = partition_dir / f"{start}_{end}"
+        part_out.mkdir(parents=True, exist_ok=True)
+        write_manifest(part_out, {
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "mode": "backfill-partition",
+            "partition": {"start": start, "end": end, **status[(start, end)]},
+            "pdf_dir": str(pdf_dir),
+            "total_genomics": len(papers),
+            "total_pdfs": sum(1 for p in papers if p.pdf_path),
+            "papers": papers,
+        }, compact=compact)
+
+    manifest = {
+        "date": datetime.now().strftime("%Y-%m-%d"),
+        "mode": "backfill",
+        "days_lookback": days,
+        "partitions": [
+            {"start": s, "end": e, "papers": writer.counts[(s, e)], **status[(s, e)]}
+            for s, e in partitions
+        ],
+        "pdf_dir": str(pdf_dir),
+        "total_fetched": total,
+        "total_genomics": len(top),
+        "total_pdfs": sum(1 for p in top if p.pdf_path),
+        "pdf_report": report.summary(),
+        "papers": top,
+    }
+    manifest_path = write_manifest(output_dir, manifest, compact=compact)
+
+    logger.info("\n" + "=" * 60)
+    logger.info("BACKFILL COMPLETE")
+    logger.info(f"  Papers: {len(top)} of {total}")
+    logger.info(f"  PDFs: {manifest['total_pdfs']}")
+    logger.info(f"  Manifest: {manifest_path}")
+    logger.info("=" * 60)
+
+    print(f"\nMANIFEST: {manifest_path}")
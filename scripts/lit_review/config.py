@@ -0,0 +1,26 @@
+"""Configuration loading."""
+
+from pathlib import Path
+from typing import Optional
+
+from . import deps
+
+# Default config path relative to the scripts dir: ../assets/config.yaml
+_SCRIPT_DIR = Path(__file__).resolve().parent.parent
+_DEFAULT_CONFIG_PATH = _SCRIPT_DIR.parent / "assets" / "config.yaml"
+
+
+def load_config(config_path: Optional[str] = None) -> dict:
+    path = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
+    if not path.exists():
+        raise FileNotFoundError(f"Config file not found: {path}")
+    with open(path) as f:
+        cfg = deps.yaml_mod.safe_load(f) or {}
+    # Ensure runtime-only defaults that aren't in the YAML
+    cfg.setdefault("download_pdfs", True)
+    cfg.setdefault("pdf_timeout", 30)
+    cfg.setdefault("max_papers_per_source", 50)
+    cfg.setdefault("sources", ["biorxiv", "journal_feeds"])
+    cfg.setdefault("manifest_jsonl", False)
+    cfg.setdefault("use_paper_store", True)
+    return cfg
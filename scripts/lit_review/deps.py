@@ -0,0 +1,37 @@
+"""
+Lazy third-party imports — installed at runtime if missing.
+
+Modules in this package reference ``deps.requests``, ``deps.feedparser`` and
+``deps.yaml_mod`` rather than importing them directly, so the package can be
+imported before :func:`install_deps` has run.
+"""
+
+import sys
+
+requests = None
+feedparser = None
+yaml_mod = None
+
+
+def install_deps():
+    """Install required packages and import them."""
+    global requests, feedparser, yaml_mod
+    import subprocess
+
+    deps = {"requests": "requests", "feedparser": "feedparser", "pyyaml": "yaml"}
+    for pkg, import_name in deps.items():
+        try:
+            __import__(import_name)
+        except ImportError:
+            subprocess.check_call(
+                [sys.executable, "-m", "pip", "install", pkg, "-q"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+    import requests as _requests
+    import feedparser as _feedparser
+    import yaml as _yaml
+
+    requests = _requests
+    feedparser = _feedparser
+    yaml_mod = _yaml
@@ -0,0 +1,368 @@
+"""
+PDF download
+============
+Resolvers (``try_*_pdf``) turn a DOI/title into a candidate PDF URL;
+:func:`download_pdf` walks them as a cascade, timing each step via
+:mod:`.instrument`, and :func:`download_pdfs` is the streaming stage that
+annotates each paper with ``pdf_path`` and ``review_mode``.
+"""
+
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from . import deps
+from .instrument import attempt
+from .records import Attempt, Paper
+
+
+def _note_response(record: Optional[Attempt], resp):
+    """Copy an API response's timing, size and any HTTP failure onto ``record``."""
+    if record is None:
+        return
+    record.ttfb = _time_to_headers(resp)
+    record.bytes = len(resp.content)
+    # 404 means "no such paper", which is an ordinary miss
+    if resp.status_code not in (200, 404):
+        record.outcome = f"http-{resp.status_code}"
+
+
+def _note_error(record: Optional[Attempt], e: Exception):
+    if record is not None:
+        record.outcome = "timeout" if isinstance(e, deps.requests.exceptions.Timeout) else "error"
+
+
+def try_semantic_scholar_pdf(
+    doi: str, title: str, timeout: int, logger: logging.Logger, record: Optional[Attempt] = None,
+) -> Optional[str]:
+    """Semantic Scholar: free API, returns openAccessPdf URL if available."""
+    # Try DOI first, fall back to title search
+    paper_id = f"DOI:{doi}" if doi else None
+    if not paper_id and not title:
+        return None
+    try:
+        if paper_id:
+            url = f"https://api.semanticscholar.org/graph/v1/paper/{paper_id}?fields=openAccessPdf"
+        else:
+            url = f"https://api.semanticscholar.org/graph/v1/paper/search?query={deps.requests.utils.quote(title[:200])}&limit=1&fields=openAccessPdf"
+        resp = deps.requests.get(url, timeout=timeout)
+        _note_response(record, resp)
+        if resp.status_code == 200:
+            data = resp.json()
+            # Search endpoint wraps results in "data" list
+            if "data" in data and data["data"]:
+                data = data["data"][0]
+            oa_pdf = data.get("openAccessPdf") or {}
+            pdf_url = oa_pdf.get("url")
+            if pdf_url:
+                # If URL points to a PMC/NCBI page, route through Europe PMC (no JS challenge)
+                pmc_match = re.search(r'(PMC\d+)', pdf_url)
+                if pmc_match and ("ncbi.nlm.nih.gov" in pdf_url or "europepmc.org" in pdf_url):
+                    pdf_url = f"https://europepmc.org/backend/ptpmcrender.fcgi?accid={pmc_match.group(1)}&blobtype=pdf"
+                # If URL points to bioRxiv (likely Cloudflare-blocked), skip it
+                elif "biorxiv.org" in pdf_url:
+                    logger.info(f"    Semantic Scholar: URL is bioRxiv (Cloudflare-blocked), skipping")
+                    return None
+                logger.info(f"    Semantic Scholar: found OA PDF")
+            else:
+                logger.info(f"    Semantic Scholar: no OA PDF available")
+            return pdf_url
+        elif resp.status_code == 404:
+            logger.info(f"    Semantic Scholar: paper not found")
+        elif resp.status_code == 429:
+            logger.warning(f"    Semantic Scholar: rate limited")
+        else:
+            logger.warning(f"    Semantic Scholar: HTTP {resp.status_code}")
+    except Exception as e:
+        _note_error(record, e)
+        logger.warning(f"    Semantic Scholar: error: {e}")
+    return None
+
+
+def try_europepmc_pdf(
+    doi: str, timeout: int, logger: logging.Logger, record: Optional[Attempt] = None,
+) -> Optional[str]:
+    """Europe PMC: resolve DOI to PMCID via Europe PMC API, then serve PDF directly (no JS challenge)."""
+    if not doi:
+        return None
+    try:
+        # Search Europe PMC by DOI
+        search_url = (
+            f"https://www.ebi.ac.uk/europepmc/webservices/rest/search"
+            f"?query=DOI:{doi}&format=json&resultType=core"
+        )
+        resp = deps.requests.get(search_url, timeout=timeout)
+        _note_response(record, resp)
+        if resp.status_code != 200:
+            logger.info(f"    Europe PMC: search HTTP {resp.status_code}")
+            return None
+
+        data = resp.json()
+        results = data.get("resultList", {}).get("result", [])
+        pmcid = None
+        for rec in results:
+            pmcid = rec.get("pmcid")
+            if pmcid:
+                break
+        if not pmcid:
+            logger.info(f"    Europe PMC: no PMCID found for DOI {doi}")
+            return None
+
+        # Europe PMC serves PDFs directly without JS proof-of-work
+        pdf_url = f"https://europepmc.org/backend/ptpmcrender.fcgi?accid={pmcid}&blobtype=pdf"
+        logger.info(f"    Europe PMC: found {pmcid}")
+        return pdf_url
+    except Exception as e:
+        _note_error(record, e)
+        logger.warning(f"    Europe PMC: error: {e}")
+    return None
+
+
+def try_core_pdf(
+    doi: str, title: str, timeout: int, logger: logging.Logger, record: Optional[Attempt] = None,
+) -> Optional[str]:
+    """CORE API: free, rate-limited (10 req/10s), returns hosted PDF URL."""
+    if not doi and not title:
+        return None
+    try:
+        # CORE search by DOI or title
+        query = doi if doi else title[:150]
+        url = f"https://api.core.ac.uk/v3/search/works?q={deps.requests.utils.quote(query)}&limit=1"
+        resp = deps.requests.get(url, timeout=timeout)
+        _note_response(record, resp)
+        if resp.status_code == 200:
+            data = resp.json()
+            results = data.get("results", [])
+            if results:
+                download_url = results[0].get("downloadUrl")
+                if download_url:
+                    logger.info(f"    CORE: found PDF")
+                    return download_url
+                else:
+                    logger.info(f"    CORE: paper found but no downloadUrl")
+            else:
+                logger.info(f"    CORE: no results")
+        elif resp.status_code == 429:
+            logger.warning(f"    CORE: rate limited")
+        else:
+            logger.warning(f"    CORE: HTTP {resp.status_code}")
+    except Exception as e:
+        _note_error(record, e)
+        logger.warning(f"    CORE: error: {e}")
+    return None
+
+
+def _import_paperscraper(logger: logging.Logger):
+    """Return ``paperscraper.pdf.save_pdf``, pip-installing paperscraper on first use; None if unavailable."""
+    try:
+        from paperscraper.pdf import save_pdf
+    except ImportError:
+        try:
+            import subprocess
+            subprocess.check_call(
+                [sys.executable, "-m", "pip", "install", "paperscraper", "-q"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            from paperscraper.pdf import save_pdf
+        except Exception as e:
+            logger.warning(f"    paperscraper: failed to install: {e}")
+            return None
+    return save_pdf
+
+
+def try_paperscraper_pdf(doi: str, pdf_path: Path, logger: logging.Logger) -> bool:
+    """paperscraper: uses DOI to download PDF with its own fallback chain (BioC-PMC, eLife, etc.)."""
+    if not doi:
+        return False
+    save_pdf = _import_paperscraper(logger)
+    if save_pdf is None:
+        return False
+    try:
+        save_pdf({"doi": doi}, filepath=str(pdf_path))
+        if pdf_path.exists() and pdf_path.stat().st_size > 1000:
+            logger.info(f"    paperscraper: PDF downloaded ({pdf_path.stat().st_size} bytes)")
+            return True
+        else:
+            logger.info(f"    paperscraper: no PDF retrieved for DOI {doi}")
+            # Clean up empty/tiny files
+            if pdf_path.exists():
+                pdf_path.unlink()
+            return False
+    except Exception as e:
+        logger.warning(f"    paperscraper: error: {e}")
+        if pdf_path.exists() and pdf_path.stat().st_size < 1000:
+            pdf_path.unlink()
+        return False
+
+
+def _time_to_headers(resp) -> float:
+    """Seconds until response headers, summed over every redirect hop.
+
+    ``resp.elapsed`` only covers the final hop; with ``allow_redirects=True``
+    the earlier hops' connect/wait time would otherwise count as transfer.
+    """
+    elapsed = sum((r.elapsed for r in resp.history), resp.elapsed)
+    return round(elapsed.total_seconds(), 3)
+
+
+def _make_descriptive_name(paper: Paper) -> str:
+    """Build a filename stem like: nature-genetics-zhang-2026-02-10-scrna-seq-tumor."""
+    # Journal
+    source = paper.source or "unknown"
+    # Strip parenthetical like "bioRxiv (genomics)" -> "bioRxiv"
+    source = re.sub(r'\s*\(.*?\)', '', source)
+    journal = re.sub(r'[^a-z0-9]+', '-', source.lower()).strip('-')
+
+    # First author last name
+    authors = paper.authors
+    first_author = authors.split(",")[0].split(";")[0].strip() if authors else "unknown"
+    # Last name is typically the last word
+    last_name = re.sub(r'[^a-z]', '', first_author.split()[-1].lower()) if first_author else "unknown"
+
+    # Date
+    pub_date = paper.date[:10] or "unknown-date"
+
+    # Topic keywords: use the genomics_keywords that matched this paper
+    matched = paper.matched_keywords
+    # Normalize to lowercase hyphenated slugs, deduplicate, take up to 4
+    seen = set()
+    kw_slugs = []
+    for kw in matched:
+        slug = re.sub(r'[^a-z0-9]+', '-', kw.lower()).strip('-')
+        if slug and slug not in seen:
+            seen.add(slug)
+            kw_slugs.append(slug)
+        if len(kw_slugs) >= 4:
+            break
+    topic = "-".join(kw_slugs) if kw_slugs else "paper"
+
+    return f"{journal}-{last_name}-{pub_date}-{topic}"
+
+
+def download_pdf(paper: Paper, output_dir: Path, timeout: int, logger: logging.Logger) -> Optional[str]:
+    safe_name = _make_descriptive_name(paper)
+    pdf_path = output_dir / f"{safe_name}.pdf"
+    title_short = paper.title[:60]
+
+    if pdf_path.exists() and pdf_path.stat().st_size > 1000:
+        logger.info(f"    Already have PDF: {title_short}...")
+        with attempt(paper, "cache", "local") as a:
+            a.outcome = "ok"
+            a.bytes = pdf_path.stat().st_size
+        return str(pdf_path)
+
+    doi = paper.doi
+    title = paper.title
+
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+        "Accept": "application/pdf,text/html,*/*",
+        "Accept-Language": "en-US,en;q=0.9",
+    }
+
+    def _try_download(source: str, url: str) -> bool:
+        """Attempt to download a PDF from url. Returns True on success."""
+        with attempt(paper, "download", source) as a:
+            try:
+                logger.info(f"    Trying {source}: {url[:100]}...")
+                resp = deps.requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+                a.ttfb = _time_to_headers(resp)
+                a.bytes = len(resp.content)
+                content_type = resp.headers.get("Content-Type", "")
+                if resp.status_code == 200 and (
+                    "pdf" in content_type.lower() or resp.content[:5] == b"%PDF-"
+                ):
+                    pdf_path.write_bytes(resp.content)
+                    a.outcome = "ok"
+                    logger.info(f"    PDF downloaded ({source}): {title_short}... ({len(resp.content)} bytes)")
+                    return True
+                else:
+                    a.outcome = "not-pdf" if resp.status_code == 200 else f"http-{resp.status_code}"
+                    logger.warning(
+                        f"    Failed ({source}): HTTP {resp.status_code}, "
+                        f"Content-Type={content_type}, body={len(resp.content)} bytes"
+                    )
+            except Exception as e:
+                _note_error(a, e)
+                logger.warning(f"    Failed ({source}): {e}")
+            return False
+
+    def _resolve(source: str, resolver, *args) -> Optional[str]:
+        """Run a ``try_*_pdf`` resolver as a timed attempt.
+
+        The resolver marks HTTP failures, rate limits and timeouts on the
+        attempt; otherwise it is ``found`` or ``miss``.
+        """
+        with attempt(paper, "resolve", source) as a:
+            url = resolver(*args, record=a)
+            if url:
+                a.outcome = "found"
+            return url
+
+    # PDF source cascade — try each source in order, stop on first success.
+    # Each step: (1) resolve the PDF URL via API, (2) attempt download.
+
+    # Source 1: Direct PDF URL (bioRxiv papers have this)
+    if paper.pdf_url:
+        if _try_download("direct", paper.pdf_url):
+            return str(pdf_path)
+    else:
+        logger.info(f"    No direct pdf_url for: {title_short}...")
+
+    # Source 2: paperscraper (has its own fallback chain: BioC-PMC, eLife, etc.)
+    # Resolves and downloads internally, so the whole chain is timed as one
+    # opaque "fetch". DOI-only, so it isn't recorded for DOI-less papers; the
+    # import (and first-use pip install) happens before the timer starts.
+    if doi and _import_paperscraper(logger):
+        with attempt(paper, "fetch", "paperscraper") as a:
+            if try_paperscraper_pdf(doi, pdf_path, logger):
+                a.outcome = "ok"
+                a.bytes = pdf_path.stat().st_size
+                return str(pdf_path)
+
+    # Source 3: Semantic Scholar (free, aggregates many OA sources)
+    s2_url = _resolve("semantic-scholar", try_semantic_scholar_pdf, doi, title, timeout, logger)
+    if s2_url and _try_download("semantic-scholar", s2_url):
+        return str(pdf_path)
+
+    # Source 4: Europe PMC (serves PDFs directly, no JS challenge)
+    europepmc_url = _resolve("europe-pmc", try_europepmc_pdf, doi, timeout, logger) if doi else None
+    if europepmc_url and _try_download("europe-pmc", europepmc_url):
+        return str(pdf_path)
+
+    # Source 5: CORE (large OA corpus, rate-limited)
+    core_url = _resolve("core", try_core_pdf, doi, title, timeout, logger)
+    if core_url and _try_download("core", core_url):
+        return str(pdf_path)
+
+    logger.warning(f"    All 5 PDF sources exhausted for: {title_short}...")
+    return None
+
+
+def download_pdfs(
+    papers: Iterable[Paper],
+    pdf_dir: Path,
+    timeout: int,
+    logger: logging.Logger,
+    total: Optional[int] = None,
+) -> Iterator[Paper]:
+    """Download each paper's PDF and yield it with ``pdf_path``/``review_mode`` set."""
+    for i, paper in enumerate(papers):
+        progress = f"{i+1}/{total}" if total is not None else f"{i+1}"
+        logger.info(f"  [{progress}] {paper.title[:60]}...")
+        pdf_path = download_pdf(paper, pdf_dir, timeout, logger)
+        paper.pdf_path = pdf_path or ""
+        paper.review_mode = "pdf" if pdf_path else "abstract"
+        yield paper
+        time.sleep(0.3)
+
+
+def skip_pdfs(papers: Iterable[Paper]) -> Iterator[Paper]:
+    """Mark papers for abstract-only review without downloading anything."""
+    for paper in papers:
+        paper.pdf_path = ""
+        paper.review_mode = "abstract"
+        yield paper
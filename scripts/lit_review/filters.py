@@ -0,0 +1,113 @@
+"""
+Filter stages
+=============
+``exclude_non_research`` and ``match_genomics`` take and return iterators of
+paper records so they can be chained lazily between a source and the
+download stage. The ``filter_*`` functions are list-returning wrappers.
+"""
+
+import logging
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+
+from .records import Paper
+
+# Used when the config has no ``exclusion_rules`` section.
+DEFAULT_EXCLUSION_RULES = {
+    "title": [
+        r'\bauthor correction\b',
+        r'\bcorrection\b.*\b(to|for)\b',
+        r'\berratum\b',
+        r'\berrata\b',
+        r'\bretraction\b',
+        r'\bwithdrawal\b',
+        r'\bexpression of concern\b',
+        r'\bpublisher\s+correction\b',
+        r'\bpublisher\s+note\b',
+        r'\bcorrigendum\b',
+        r'\badditional information\b.*\bcorrection\b',
+    ],
+}
+
+_RULE_FIELDS = ("title", "article_type", "url")
+
+
+@lru_cache(maxsize=None)
+def _compile_rules(rules: tuple[tuple[str, tuple[str, ...]], ...]) -> tuple[tuple[str, re.Pattern], ...]:
+    return tuple(
+        (field, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE))
+        for field, patterns in rules
+        if patterns
+    )
+
+
+def compile_exclusion_rules(rules: Optional[dict] = None) -> tuple[tuple[str, re.Pattern], ...]:
+    """Compile ``{field: [regex, ...]}`` into one alternation per field.
+
+    Fields are Paper attributes: ``title``, ``article_type`` (RSS
+    ``dc:type``/``prism:section``) and ``url``. Results are cached, so calling
+    this per run or per poll cycle does not recompile.
+    """
+    rules = DEFAULT_EXCLUSION_RULES if rules is None else rules
+    unknown = set(rules) - set(_RULE_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown exclusion_rules field(s): {', '.join(sorted(unknown))} "
+            f"(expected: {', '.join(_RULE_FIELDS)})"
+        )
+    return _compile_rules(tuple((field, tuple(rules[field] or ())) for field in _RULE_FIELDS if field in rules))
+
+
+def exclusion_field(paper: Paper, compiled: tuple[tuple[str, re.Pattern], ...]) -> Optional[str]:
+    """Name of the first field whose rule matches ``paper``, or None if it is research."""
+    for field, pattern in compiled:
+        if pattern.search(getattr(paper, field)):
+            return field
+    return None
+
+
+def genomics_matches(paper: Paper, keywords: list[str]) -> tuple[str, ...]:
+    text = f"{paper.title} {paper.abstract}".lower()
+    return tuple(kw for kw in keywords if kw.lower() in text)
+
+
+def exclude_non_research(
+    papers: Iterable[Paper],
+    logger: logging.Logger,
+    rules: Optional[dict] = None,
+) -> Iterator[Paper]:
+    """Drop corrections, errata, editorials, news and other non-research content."""
+    compiled = compile_exclusion_rules(rules)
+
+    excluded = Counter()
+    for p in papers:
+        field = exclusion_field(p, compiled)
+        if field:
+            excluded[field] += 1
+            logger.debug(f"  Excluded ({field}): {p.title[:60]}...")
+            continue
+        yield p
+
+    if excluded:
+        by_field = ", ".join(f"{field}: {n}" for field, n in excluded.items())
+        logger.info(f"  Filtered out {sum(excluded.values())} non-research articles ({by_field})")
+
+
+def match_genomics(papers: Iterable[Paper], keywords: list[str]) -> Iterator[Paper]:
+    """Yield papers whose title/abstract match a keyword, tagging ``matched_keywords``."""
+    for p in papers:
+        matched = genomics_matches(p, keywords)
+        if matched:
+            p.matched_keywords = matched
+            yield p
+
+
+def filter_non_research_articles(papers: list[Paper], logger: logging.Logger, rules: Optional[dict] = None) -> list[Paper]:
+    """Filter out corrections, errata, retractions, and other non-research content."""
+    return list(exclude_non_research(papers, logger, rules))
+
+
+def filter_genomics(papers: list[Paper], keywords: list[str]) -> list[Paper]:
+    return list(match_genomics(papers, keywords))
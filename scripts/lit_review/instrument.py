@@ -0,0 +1,127 @@
+"""
+PDF cascade instrumentation
+===========================
+Every resolver call (``try_*_pdf``) and download attempt in
+:func:`~lit_review.download.download_pdf` runs inside :func:`attempt`, which
+times it, appends an :class:`~lit_review.records.Attempt` to
+``paper.pdf_attempts`` (so it lands in the manifest entry) and passes it to
+each registered hook. With no hooks registered this costs a
+``perf_counter`` call per attempt.
+
+Hooks are plain callables ``hook(paper, attempt)``; register them with
+:func:`add_hook` to feed your own metrics or tracing backend.
+:class:`AttemptReport` is the built-in hook; the manifest's ``pdf_report``
+section is built from the attempts the papers carry, so it also covers PDFs
+fetched earlier by watch mode::
+
+    report = AttemptReport.from_papers(papers)   # or add_hook(AttemptReport())
+    for row in report.summary():
+        print(row["stage"], row["source"], row["mean_seconds"])
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator
+
+from .records import Attempt, Paper
+
+Hook = Callable[[Paper, Attempt], None]
+
+_HOOKS: list[Hook] = []
+
+_SUCCESS = ("ok", "found")
+
+
+def add_hook(hook: Hook):
+    _HOOKS.append(hook)
+
+
+def remove_hook(hook: Hook):
+    if hook in _HOOKS:
+        _HOOKS.remove(hook)
+
+
+@contextmanager
+def attempt(paper: Paper, stage: str, source: str) -> Iterator[Attempt]:
+    """Time the enclosed step; the body sets ``outcome``/``bytes``/``ttfb`` on the yielded Attempt."""
+    record = Attempt(stage, source)
+    start = time.perf_counter()
+    try:
+        yield record
+    except BaseException:
+        record.outcome = "error"
+        raise
+    finally:
+        record.seconds = round(time.perf_counter() - start, 3)
+        paper.pdf_attempts.append(record)
+        for hook in list(_HOOKS):
+            try:
+                hook(paper, record)
+            except Exception as e:
+                # A broken metrics hook must not break the download cascade
+                logging.getLogger(__name__).warning(f"Instrumentation hook failed: {e}")
+
+
+class AttemptReport:
+    """Hook aggregating attempts per (stage, source)."""
+
+    def __init__(self):
+        self._rows: dict[tuple[str, str], dict] = {}
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[Paper]) -> "AttemptReport":
+        """Aggregate the ``pdf_attempts`` already recorded on ``papers``."""
+        report = cls()
+        for paper in papers:
+            for record in paper.pdf_attempts:
+                report(paper, record)
+        return report
+
+    def __call__(self, paper: Paper, record: Attempt):
+        row = self._rows.setdefault((record.stage, record.source), {
+            "stage": record.stage,
+            "source": record.source,
+            "attempts": 0,
+            "successes": 0,
+            "total_seconds": 0.0,
+            "max_seconds": 0.0,
+            "ttfb_seconds": 0.0,
+            "bytes": 0,
+            "outcomes": {},
+        })
+        row["attempts"] += 1
+        row["successes"] += record.outcome in _SUCCESS
+        row["total_seconds"] += record.seconds
+        row["max_seconds"] = max(row["max_seconds"], record.seconds)
+        row["ttfb_seconds"] += record.ttfb
+        row["bytes"] += record.bytes
+        row["outcomes"][record.outcome] = row["outcomes"].get(record.outcome, 0) + 1
+
+    def summary(self) -> list[dict]:
+        """Rows sorted by total time spent, slowest source first."""
+        rows = []
+        for row in self._rows.values():
+            n = row["attempts"]
+            rows.append({
+                **row,
+                "outcomes": dict(row["outcomes"]),
+                "total_seconds": round(row["total_seconds"], 3),
+                "ttfb_seconds": round(row["ttfb_seconds"], 3),
+                "mean_seconds": round(row["total_seconds"] / n, 3),
+                "success_rate": round(row["successes"] / n, 3),
+            })
+        return sorted(rows, key=lambda r: r["total_seconds"], reverse=True)
+
+    def log(self, logger: logging.Logger):
+        rows = self.summary()
+        if not rows:
+            return
+        logger.info("  PDF source timing (slowest first):")
+        for r in rows:
+            logger.info(
+                f"    {r['stage']:<8} {r['source']:<17} {r['attempts']:>4} tries  "
+                f"{r['success_rate']:>5.0%} ok  {r['total_seconds']:>8.1f}s total  "
+                f"{r['mean_seconds']:>6.2f}s mean  {r['max_seconds']:>6.1f}s max  "
+                f"{r['bytes'] / 1e6:>7.1f} MB"
+            )
@@ -0,0 +1,263 @@
+"""
+Pipelines
+=========
+End-to-end runs that chain sources -> filters -> download and write the
+JSON manifest consumed by the review skill.
+"""
+
+import json
+import logging
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .download import download_pdfs, skip_pdfs
+from .filters import exclude_non_research, match_genomics
+from .instrument import AttemptReport, add_hook, remove_hook
+from .records import Paper, dumps_jsonl, paper_to_dict
+from .sources import iter_dois, iter_sources
+from .store import PaperStore, store_path
+
+
+def setup_logging(name: str) -> logging.Logger:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    return logging.getLogger(name)
+
+
+def _prepare_dirs(cfg: dict) -> tuple[Path, Path]:
+    output_dir = Path(cfg.get("output_dir", "output"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # PDFs go to a shared folder alongside the date-stamped output dir
+    pdf_dir = output_dir.parent / "pdfs"
+    pdf_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir, pdf_dir
+
+
+def _counted(papers: Iterable[Paper], counter: list[int]) -> Iterator[Paper]:
+    """Pass papers through unchanged, tallying them in ``counter[0]``."""
+    for p in papers:
+        counter[0] += 1
+        yield p
+
+
+@contextmanager
+def pdf_report() -> Iterator[AttemptReport]:
+    """Collect per-source PDF cascade timings for the duration of the block."""
+    report = AttemptReport()
+    add_hook(report)
+    try:
+        yield report
+    finally:
+        remove_hook(report)
+
+
+def write_manifest(output_dir: Path, manifest: dict, compact: bool = False) -> Path:
+    """Write ``manifest.json`` (indented, read by the review skill).
+
+    With ``compact=True`` also write ``manifest.jsonl``: the header fields on
+    the first line, then one compact line per paper.
+    """
+    papers = manifest.get("papers", [])
+    manifest_path = output_dir / "manifest.json"
+    manifest_path.write_text(json.dumps(
+        {**manifest, "papers": [paper_to_dict(p) for p in papers]}, indent=2, default=str,
+    ))
+    if compact:
+        header = {k: v for k, v in manifest.items() if k != "papers"}
+        with open(output_dir / "manifest.jsonl", "wb") as f:
+            f.write(json.dumps(header, separators=(",", ":"), default=str).encode() + b"\n")
+            f.writelines(dumps_jsonl(papers))
+    return manifest_path
+
+
+def _fill_gap(cfg: dict, store: PaperStore, gap: tuple[str, str], logger: logging.Logger) -> int:
+    """Fetch ``gap`` (inclusive dates) into the store's ready queue; PDFs are left for the run."""
+    gap_cfg = {**cfg, "start_date": gap[0], "end_date": gap[1]}
+    stream = (p for p in iter_sources(gap_cfg, logger) if store.is_new(p))
+    stream = exclude_non_research(stream, logger, cfg.get("exclusion_rules"))
+    added = 0
+    try:
+        for paper in match_genomics(stream, cfg["genomics_keywords"]):
+            store.enqueue(paper)
+            store.mark_seen(paper)
+            added += 1
+    finally:
+        store.save()
+    logger.info(f"  Queued {added} papers from {gap[0]} to {gap[1]}")
+    return added
+
+
+def run(cfg: dict):
+    logger = setup_logging("fetch-papers")
+    output_dir, pdf_dir = _prepare_dirs(cfg)
+
+    logger.info("=" * 60)
+    logger.info("FETCH & DOWNLOAD — Genomics Paper Collector")
+    logger.info("=" * 60)
+
+    max_eval = cfg.get("max_papers_to_evaluate", 30)
+    # total_fetched keeps its original meaning: papers from all sources after
+    # dropping corrections/errata, so every source is read to the end.
+    kept, matched = [0], [0]
+
+    # If watch mode has been filling the paper store, start from its ready
+    # queue (already filtered, PDFs already fetched) instead of fetching,
+    # after fetching any dates the watcher did not cover.
+    queue_dir = store_path(cfg)
+    queued = []
+    if cfg.get("use_paper_store", True) and (queue_dir / "state.json").exists():
+        store = PaperStore(queue_dir)
+        if store.last_poll is not None:
+            stale_after = timedelta(minutes=2 * cfg.get("watch_interval_minutes", 60))
+            gap = store.coverage_gap(cfg["days_lookback"], stale_after)
+            if gap:
+                logger.warning(
+                    f"  Watch mode last polled {store.last_poll:%Y-%m-%d %H:%M} and did not "
+                    f"cover {gap[0]} to {gap[1]}; fetching that range"
+                )
+                _fill_gap(cfg, store, gap, logger)
+            since = (datetime.now() - timedelta(days=cfg["days_lookback"])).strftime("%Y-%m-%d")
+            queued = store.take_ready(max_eval, since=since)
+            if not queued:
+                logger.info("  Paper store has no ready papers; fetching instead")
+
+    if queued:
+        logger.info(f"\nSteps 1-3: Using {len(queued)} pre-fetched papers from {queue_dir}")
+        kept[0] = matched[0] = len(queued)
+        genomics = queued
+    else:
+        # Steps 1-3 run as one lazy stream: fetch -> drop corrections/errata ->
+        # keep genomics. Only the first max_eval genomics papers are held.
+        logger.info("\nSteps 1-3: Fetching papers, filtering out corrections/errata, filtering to genomics...")
+        stream = exclude_non_research(iter_sources(cfg, logger), logger, cfg.get("exclusion_rules"))
+        stream = _counted(match_genomics(_counted(stream, kept), cfg["genomics_keywords"]), matched)
+        genomics = []
+        for paper in stream:
+            if len(genomics) < max_eval:
+                genomics.append(paper)
+    logger.info(f"  Total fetched: {kept[0]}")
+    logger.info(f"  Filtered {kept[0]} -> {matched[0]} genomics papers")
+    if matched[0] > max_eval:
+        logger.info(f"  Capping at {max_eval} papers")
+
+    if not genomics:
+        logger.warning("  No genomics papers found. Exiting.")
+        manifest = {"papers": [], "pdf_dir": str(pdf_dir), "date": datetime.now().strftime("%Y-%m-%d")}
+        manifest_path = write_manifest(output_dir, manifest)
+        print(f"\nMANIFEST: {manifest_path}")
+        return
+
+    # Step 4: Download PDFs (papers from the store already have a review_mode)
+    todo = [p for p in genomics if not p.review_mode]
+    if cfg.get("download_pdfs", True):
+        logger.info("\nStep 4: Downloading PDFs...")
+        timeout = cfg.get("pdf_timeout", 30)
+        for _ in download_pdfs(todo, pdf_dir, timeout, logger, total=len(todo)):
+            pass
+
+        pdf_count = sum(1 for p in genomics if p.pdf_path)
+        logger.info(f"  Downloaded {pdf_count}/{len(genomics)} PDFs")
+    else:
+        logger.info("\nStep 4: Skipping PDF download (--no-pdf)")
+        for _ in skip_pdfs(todo):
+            pass
+    # Includes attempts made by watch mode for papers taken from the store
+    report = AttemptReport.from_papers(genomics)
+    report.log(logger)
+
+    # Step 5: Write manifest
+    manifest = {
+        "date": datetime.now().strftime("%Y-%m-%d"),
+        "days_lookback": cfg["days_lookback"],
+        "pdf_dir": str(pdf_dir),
+        "total_fetched": kept[0],
+        "total_genomics": len(genomics),
+        "total_pdfs": sum(1 for p in genomics if p.pdf_path),
+        "pdf_report": report.summary(),
+        "papers": genomics,
+    }
+    manifest_path = write_manifest(output_dir, manifest, compact=cfg.get("manifest_jsonl", False))
+
+    logger.info("\n" + "=" * 60)
+    logger.info("FETCH COMPLETE")
+    logger.info(f"  Papers: {len(genomics)}")
+    logger.info(f"  PDFs: {manifest['total_pdfs']}")
+    logger.info(f"  Manifest: {manifest_path}")
+    logger.info("=" * 60)
+
+    # Print the manifest path on its own line for easy parsing
+    print(f"\nMANIFEST: {manifest_path}")
+
+
+# ---------------------------------------------------------------------------
+# DOI-Specific Mode
+# ---------------------------------------------------------------------------
+def run_doi_mode(cfg: dict, dois: list[str]):
+    """Process specific DOIs instead of batch fetching."""
+    logger = setup_logging("fetch-papers-doi")
+    output_dir, pdf_dir = _prepare_dirs(cfg)
+
+    logger.info("=" * 60)
+    logger.info("FETCH & DOWNLOAD — DOI-Specific Mode")
+    logger.info("=" * 60)
+    logger.info(f"  Processing {len(dois)} DOI(s)")
+
+    # Step 1: Fetch metadata for each DOI
+    logger.info("\nStep 1: Fetching paper metadata from Semantic Scholar...")
+    papers = list(iter_dois({**cfg, "dois": dois}, logger))
+
+    if not papers:
+        logger.error("  No papers could be fetched. Exiting.")
+        return
+
+    logger.info(f"  Successfully fetched {len(papers)}/{len(dois)} papers")
+
+    # Step 2: Extract genomics keywords
+    logger.info("\nStep 2: Extracting genomics keywords...")
+    genomics_keywords = cfg.get("genomics_keywords", [])
+    for paper in papers:
+        text = f"{paper.title} {paper.abstract}".lower()
+        matched = tuple(kw for kw in genomics_keywords if kw.lower() in text)
+        paper.matched_keywords = matched if matched else ("genomics",)
+        logger.info(f"  {paper.title[:50]}... -> keywords: {', '.join(paper.matched_keywords[:4])}")
+
+    # Step 3: Download PDFs
+    if cfg.get("download_pdfs", True):
+        logger.info("\nStep 3: Downloading PDFs...")
+        timeout = cfg.get("pdf_timeout", 30)
+        papers = list(download_pdfs(papers, pdf_dir, timeout, logger, total=len(papers)))
+
+        pdf_count = sum(1 for p in papers if p.pdf_path)
+        logger.info(f"  Downloaded {pdf_count}/{len(papers)} PDFs")
+    else:
+        logger.info("\nStep 3: Skipping PDF download (--no-pdf)")
+        papers = list(skip_pdfs(papers))
+    report = AttemptReport.from_papers(papers)
+    report.log(logger)
+
+    # Step 4: Write manifest
+    manifest = {
+        "date": datetime.now().strftime("%Y-%m-%d"),
+        "mode": "doi-specific",
+        "dois": dois,
+        "pdf_dir": str(pdf_dir),
+        "total_fetched": len(papers),
+        "total_pdfs": sum(1 for p in papers if p.pdf_path),
+        "pdf_report": report.summary(),
+        "papers": papers,
+    }
+    manifest_path = write_manifest(output_dir, manifest, compact=cfg.get("manifest_jsonl", False))
+
+    logger.info("\n" + "=" * 60)
+    logger.info("DOI FETCH COMPLETE")
+    logger.info(f"  Papers: {len(papers)}")
+    logger.info(f"  PDFs: {manifest['total_pdfs']}")
+    logger.info(f"  Manifest: {manifest_path}")
+    logger.info("=" * 60)
+
+    print(f"\nMANIFEST: {manifest_path}")
@@ -0,0 +1,23 @@
+"""
+Process-wide rate limiting
+==========================
+:func:`throttle` spaces calls that share a key (usually an API host) by a
+minimum interval across all threads, so parallel fetchers (backfill
+partitions) respect the same per-host limits as a serial run.
+"""
+
+import threading
+import time
+
+_lock = threading.Lock()
+_next_slot: dict[str, float] = {}
+
+
+def throttle(key: str, interval: float):
+    """Block until ``interval`` seconds have passed since the last slot for ``key``."""
+    with _lock:
+        now = time.monotonic()
+        slot = max(now, _next_slot.get(key, 0.0))
+        _next_slot[key] = slot + interval
+    if slot > now:
+        time.sleep(slot - now)
@@ -0,0 +1,148 @@
+"""
+Paper records
+=============
+:class:`Paper` is the record type that flows through every stage. It uses
+``__slots__`` and interns low-cardinality strings (source, article type,
+review mode, matched keywords) so week-long or multi-week runs don't pay per-record dict
+overhead. Records are validated once, at the boundary (:meth:`Paper.from_dict`),
+so downstream code can read attributes directly.
+
+Serialization: :func:`paper_to_dict` feeds the indented ``manifest.json``;
+:func:`dumps_jsonl` / :func:`loads_jsonl` give a compact one-record-per-line
+form, using ``orjson`` when it is installed and compact ``json`` otherwise.
+"""
+
+import hashlib
+import json
+import sys
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Iterable, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+_STR_FIELDS = ("uid", "title", "authors", "abstract", "source", "url", "doi", "date", "pdf_url", "article_type", "pdf_path", "review_mode")
+
+
+@dataclass(slots=True)
+class Attempt:
+    """One timed step of the PDF cascade (see :mod:`.instrument`)."""
+    stage: str             # "resolve" (find a URL), "download", "fetch" (resolve + download), "cache"
+    source: str            # e.g. "direct", "paperscraper", "semantic-scholar"
+    outcome: str = "miss"  # "ok"/"found" on success; "miss", "not-pdf", "http-<status>", "error"
+    seconds: float = 0.0   # wall time
+    ttfb: float = 0.0      # request sent -> response headers, over all redirect hops (connect + TLS + server wait)
+    bytes: int = 0
+
+    def __post_init__(self):
+        self.stage = sys.intern(self.stage)
+        self.source = sys.intern(self.source)
+        self.outcome = sys.intern(self.outcome)
+
+
+@dataclass(slots=True)
+class Paper:
+    uid: str
+    title: str
+    authors: str = ""
+    abstract: str = ""
+    source: str = ""
+    url: str = ""
+    doi: str = ""
+    date: str = ""
+    pdf_url: str = ""
+    article_type: str = ""
+    matched_keywords: tuple[str, ...] = ()
+    pdf_path: str = ""
+    review_mode: str = ""
+    pdf_attempts: list[Attempt] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.source = sys.intern(self.source)
+        self.article_type = sys.intern(self.article_type)
+        self.review_mode = sys.intern(self.review_mode)
+        self.matched_keywords = tuple(sys.intern(kw) for kw in self.matched_keywords)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Paper":
+        """Validate a free-form dict (e.g. from a custom source or a manifest)."""
+        values = {}
+        for name in _STR_FIELDS:
+            value = data.get(name)
+            if value is None:
+                value = ""
+            elif isinstance(value, list) and name == "authors":
+                value = ", ".join(str(a) for a in value)
+            elif not isinstance(value, str):
+                raise ValueError(f"Paper field {name!r} must be a string, got {type(value).__name__}")
+            values[name] = value.strip() if name == "title" else value
+        if not values["title"]:
+            raise ValueError(f"Paper record has no title: {data!r:.100}")
+        if not values["uid"]:
+            values["uid"] = make_uid(values["doi"] or values["title"])
+        keywords = data.get("matched_keywords") or ()
+        if isinstance(keywords, str) or not all(isinstance(kw, str) for kw in keywords):
+            raise ValueError("Paper field 'matched_keywords' must be a list of strings")
+        try:
+            attempts = [Attempt(**a) for a in data.get("pdf_attempts") or ()]
+        except TypeError as e:
+            raise ValueError(f"Paper field 'pdf_attempts' is malformed: {e}") from None
+        return cls(matched_keywords=tuple(keywords), pdf_attempts=attempts, **values)
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(Paper))
+
+
+def make_uid(key: str) -> str:
+    return hashlib.md5(key.encode()).hexdigest()[:12]
+
+
+def rank_key(paper: Paper) -> tuple:
+    """Sort key for picking papers to review: most matched keywords, then newest."""
+    return len(paper.matched_keywords), paper.date
+
+
+def as_paper(record: Union[Paper, dict]) -> Paper:
+    return record if isinstance(record, Paper) else Paper.from_dict(record)
+
+
+def paper_to_dict(paper: Paper) -> dict:
+    data = {name: getattr(paper, name) for name in _FIELD_NAMES}
+    data["matched_keywords"] = list(paper.matched_keywords)
+    data["pdf_attempts"] = [asdict(a) for a in paper.pdf_attempts]
+    return data
+
+
+def dumps_jsonl(papers: Iterable[Paper]) -> Iterator[bytes]:
+    """Yield one compact JSON line (bytes, newline-terminated) per paper."""
+    for paper in papers:
+        data = paper_to_dict(paper)
+        if orjson is not None:
+            yield orjson.dumps(data) + b"\n"
+        else:
+            yield json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+
+
+def loads_jsonl(lines: Iterable[Union[bytes, str]]) -> Iterator[Paper]:
+    for line in lines:
+        if line.strip():
+            data = orjson.loads(line) if orjson is not None else json.loads(line)
+            yield Paper.from_dict(data)
+
+
+def write_papers_jsonl(path: Path, papers: Iterable[Paper]) -> int:
+    """Write papers as JSONL to ``path``; returns the number written."""
+    count = 0
+    with open(path, "wb") as f:
+        for line in dumps_jsonl(papers):
+            f.write(line)
+            count += 1
+    return count
+
+
+def read_papers_jsonl(path: Path) -> Iterator[Paper]:
+    with open(path, "rb") as f:
+        yield from loads_jsonl(f)
@@ -0,0 +1,308 @@
+"""
+Paper sources
+=============
+Each source is a generator ``(cfg, logger) -> Iterator[Paper]`` that yields
+paper records as they are parsed, so callers can stop consuming early or
+stream them into later stages without holding whole result sets in memory.
+
+Sources are looked up by name in :data:`SOURCES`. Add your own (medRxiv,
+arXiv q-bio, PubMed E-utilities, an internal index, ...) with
+:func:`register_source` and list its name under ``sources:`` in the config::
+
+    @register_source("medrxiv", label="medRxiv")
+    def iter_medrxiv(cfg, logger):
+        ...
+        yield Paper(uid=..., title=..., ...)
+
+Sources may also yield plain dicts; :func:`iter_sources` validates them into
+:class:`~lit_review.records.Paper` records at the boundary.
+
+Sources log and skip network errors rather than raising. Callers that need
+to know a result is incomplete (backfill, watch) pass a list as
+``cfg["fetch_errors"]``; sources append a message for every request that
+failed, via :func:`note_fetch_error`.
+"""
+
+import logging
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from . import deps
+from .ratelimit import throttle
+from .records import Paper, as_paper, make_uid
+
+SourceFn = Callable[[dict, logging.Logger], Iterator[Union[Paper, dict]]]
+
+SOURCES: dict[str, SourceFn] = {}
+_SOURCE_LABELS: dict[str, str] = {}
+_PARTITIONED: set[str] = set()
+
+
+def register_source(
+    name: str, label: Optional[str] = None, partitioned: bool = False,
+) -> Callable[[SourceFn], SourceFn]:
+    """Decorator registering a generator source under ``name``.
+
+    ``partitioned=True`` declares that the source honours ``cfg["start_date"]``
+    / ``cfg["end_date"]`` (YYYY-MM-DD), so backfill can fetch date partitions
+    of it in parallel. Other sources are fetched once over the whole range.
+    """
+    def decorator(fn: SourceFn) -> SourceFn:
+        SOURCES[name] = fn
+        _SOURCE_LABELS[name] = label or name
+        if partitioned:
+            _PARTITIONED.add(name)
+        return fn
+    return decorator
+
+
+def is_partitioned(name: str) -> bool:
+    return name in _PARTITIONED
+
+
+def note_fetch_error(cfg: dict, message: str):
+    errors = cfg.get("fetch_errors")
+    if errors is not None:
+        errors.append(message)
+
+
+def get_source(name: str) -> SourceFn:
+    try:
+        return SOURCES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown source: {name!r} (available: {', '.join(sorted(SOURCES))})"
+        ) from None
+
+
+def iter_sources(cfg: dict, logger: logging.Logger, names: Optional[Iterable[str]] = None) -> Iterator[Paper]:
+    """Chain the configured sources (``cfg["sources"]``) into one validated stream."""
+    for name in names if names is not None else cfg.get("sources", ["biorxiv", "journal_feeds"]):
+        source = get_source(name)
+        logger.info(f" [{_SOURCE_LABELS[name]}]")
+        for record in source(cfg, logger):
+            try:
+                yield as_paper(record)
+            except ValueError as e:
+                logger.warning(f"    Invalid record from {name}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Source 1: bioRxiv
+# ---------------------------------------------------------------------------
+@register_source("biorxiv", label="bioRxiv", partitioned=True)
+def iter_biorxiv(cfg: dict, logger: logging.Logger) -> Iterator[Paper]:
+    days = cfg["days_lookback"]
+    end_date = cfg.get("end_date") or datetime.now().strftime("%Y-%m-%d")
+    start_date = cfg.get("start_date") or (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    limit = cfg["max_papers_per_source"]
+    seen = set()
+
+    for cat in cfg["biorxiv_categories"]:
+        logger.info(f"  bioRxiv category: {cat} ({start_date} to {end_date})")
+        cursor = 0
+        count = 0
+        while count < limit:
+            url = (
+                f"https://api.biorxiv.org/details/biorxiv/"
+                f"{start_date}/{end_date}/{cursor}/json"
+            )
+            # Shared across threads so parallel backfill partitions don't
+            # multiply the request rate
+            throttle("api.biorxiv.org", 0.5)
+            try:
+                resp = deps.requests.get(url, timeout=30)
+                resp.raise_for_status()
+                data = resp.json()
+            except Exception as e:
+                logger.warning(f"    bioRxiv API error: {e}")
+                note_fetch_error(cfg, f"bioRxiv {cat} {start_date}..{end_date} at cursor {cursor}: {e}")
+                break
+
+            collection = data.get("collection", [])
+            if not collection:
+                break
+
+            for item in collection:
+                if count >= limit:
+                    break
+                item_cat = item.get("category", "").lower()
+                if cat.lower() not in item_cat:
+                    continue
+                doi = item.get("doi", "")
+                version = item.get("version", "1")
+                title = item.get("title", "").strip()
+                abstract = item.get("abstract", "")
+                if not (title and abstract):
+                    continue
+                count += 1
+                # Deduplicate across categories
+                key = doi or title
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield Paper(
+                    uid=make_uid(key),
+                    title=title,
+                    authors=item.get("authors", ""),
+                    abstract=abstract,
+                    source=f"bioRxiv ({item_cat})",
+                    url=f"https://doi.org/{doi}",
+                    doi=doi,
+                    date=item.get("date", ""),
+                    pdf_url=f"https://www.biorxiv.org/content/{doi}v{version}.full.pdf",
+                    article_type=item.get("type", ""),
+                )
+
+            cursor += len(collection)
+            if len(collection) < 30:
+                break
+
+        logger.info(f"    {count} papers found")
+
+
+def fetch_biorxiv(cfg: dict, logger: logging.Logger) -> list[Paper]:
+    return list(iter_biorxiv(cfg, logger))
+
+
+# ---------------------------------------------------------------------------
+# Source 2: Journal RSS Feeds
+# ---------------------------------------------------------------------------
+@register_source("journal_feeds", label="Journal RSS Feeds")
+def iter_journal_feeds(cfg: dict, logger: logging.Logger) -> Iterator[Paper]:
+    if cfg.get("start_date"):
+        cutoff = datetime.strptime(cfg["start_date"], "%Y-%m-%d")
+    else:
+        cutoff = datetime.now() - timedelta(days=cfg["days_lookback"])
+    # Optional {feed_url: {"etag", "modified"}} map (set by watch mode) for
+    # conditional requests; updated in place with the new validators once
+    # all of a feed's entries have been consumed, so an interrupted consumer
+    # re-reads the feed next time instead of getting a 304.
+    http_cache = cfg.get("http_cache")
+
+    for journal_name, feed_url in cfg["journal_feeds"].items():
+        logger.info(f"  RSS: {journal_name}")
+        validators = http_cache.get(feed_url, {}) if http_cache is not None else {}
+        try:
+            feed = deps.feedparser.parse(
+                feed_url, etag=validators.get("etag"), modified=validators.get("modified"),
+            )
+        except Exception as e:
+            logger.warning(f"    Parse error: {e}")
+            note_fetch_error(cfg, f"RSS {journal_name}: {e}")
+            continue
+        if getattr(feed, "status", None) == 304:
+            logger.info("    Not modified")
+            continue
+
+        count = 0
+        for entry in feed.entries[: cfg["max_papers_per_source"]]:
+            pub_date = ""
+            skip = False
+            for date_attr in ("published_parsed", "updated_parsed"):
+                parsed = getattr(entry, date_attr, None)
+                if parsed:
+                    try:
+                        entry_dt = datetime(*parsed[:6])
+                        if entry_dt < cutoff:
+                            skip = True
+                            break
+                        pub_date = entry_dt.strftime("%Y-%m-%d")
+                        break
+                    except Exception:
+                        pass
+            if skip:
+                continue
+
+            title = entry.get("title", "").strip()
+            abstract = entry.get("summary", entry.get("description", "")).strip()
+            abstract = re.sub(r"<[^>]+>", "", abstract)
+            link = entry.get("link", "")
+            doi = entry.get("prism_doi", entry.get("dc_identifier", ""))
+            authors = entry.get("author", entry.get("dc_creator", ""))
+            # e.g. "Article", "News & Views", "Research Highlight", "Correction"
+            article_type = entry.get("dc_type") or entry.get("prism_section") or ""
+
+            if title:
+                count += 1
+                yield Paper(
+                    uid=make_uid(doi or title),
+                    title=title,
+                    authors=authors if isinstance(authors, str) else ", ".join(authors) if isinstance(authors, list) else "",
+                    abstract=abstract,
+                    source=journal_name,
+                    url=link,
+                    doi=doi,
+                    date=pub_date,
+                    article_type=article_type if isinstance(article_type, str) else "",
+                )
+
+        logger.info(f"    {count} entries")
+        if http_cache is not None and (feed.get("etag") or feed.get("modified")):
+            http_cache[feed_url] = {"etag": feed.get("etag"), "modified": feed.get("modified")}
+        time.sleep(0.3)
+
+
+def fetch_journal_feeds(cfg: dict, logger: logging.Logger) -> list[Paper]:
+    return list(iter_journal_feeds(cfg, logger))
+
+
+# ---------------------------------------------------------------------------
+# Source 3: DOI list (Semantic Scholar metadata)
+# ---------------------------------------------------------------------------
+def fetch_paper_by_doi(doi: str, logger: logging.Logger) -> Optional[Paper]:
+    """Fetch paper metadata from DOI using Semantic Scholar API."""
+    try:
+        url = f"https://api.semanticscholar.org/graph/v1/paper/DOI:{doi}?fields=title,authors,abstract,year,venue,externalIds,openAccessPdf"
+        resp = deps.requests.get(url, timeout=30)
+        if resp.status_code == 200:
+            data = resp.json()
+
+            # Extract authors
+            authors_list = data.get("authors", [])
+            authors = "; ".join([f"{a.get('name', '')}" for a in authors_list if a.get('name')])
+
+            # Extract publication date
+            year = data.get("year", "")
+            pub_date = f"{year}-01-01" if year else datetime.now().strftime("%Y-%m-%d")
+
+            # Extract source/venue
+            venue = data.get("venue", "Unknown")
+
+            # Extract OpenAccess PDF URL
+            oa_pdf = data.get("openAccessPdf") or {}
+            pdf_url = oa_pdf.get("url", "")
+
+            paper = Paper.from_dict({
+                "uid": make_uid(doi),
+                "title": data.get("title"),
+                "authors": authors,
+                "abstract": data.get("abstract"),
+                "source": venue,
+                "url": f"https://doi.org/{doi}",
+                "doi": doi,
+                "date": pub_date,
+                "pdf_url": pdf_url,
+            })
+
+            logger.info(f"  Fetched metadata for DOI: {doi}")
+            return paper
+        elif resp.status_code == 404:
+            logger.warning(f"  DOI not found in Semantic Scholar: {doi}")
+        else:
+            logger.warning(f"  Semantic Scholar HTTP {resp.status_code} for DOI: {doi}")
+    except Exception as e:
+        logger.warning(f"  Error fetching DOI {doi}: {e}")
+    return None
+
+
+@register_source("doi", label="DOI list")
+def iter_dois(cfg: dict, logger: logging.Logger) -> Iterator[Paper]:
+    """Yield metadata for each DOI in ``cfg["dois"]``."""
+    for doi in cfg.get("dois", []):
+        paper = fetch_paper_by_doi(doi, logger)
+        if paper:
+            yield paper
+        time.sleep(0.5)  # Rate limiting
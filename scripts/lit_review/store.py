@@ -0,0 +1,175 @@
+"""
+Paper store
+===========
+On-disk state shared by ``watch`` mode and the weekly run::
+
+    store/
+      queue.jsonl          # ready queue: filtered papers, PDFs already fetched
+      state.json           # seen uids, HTTP validators (ETag/Last-Modified) per feed,
+                           # and which dates completed polls have covered
+      archive/             # queues already handed to a weekly run
+
+``watch`` appends to the queue as papers appear; :meth:`PaperStore.take_ready`
+moves the best-ranked papers into ``archive/``, archives papers older than the
+run's lookback window and leaves the rest queued, so the weekly run starts on
+pre-fetched material while the watcher keeps appending. Appends and takes
+hold ``queue.lock``, so neither loses the other's lines. :meth:`PaperStore.coverage_gap` tells the weekly run which dates
+the watcher missed (it started late, or stopped polling).
+"""
+
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from .records import Paper, dumps_jsonl, rank_key, read_papers_jsonl
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, so don't take while a watcher runs
+    fcntl = None
+
+
+class PaperStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.queue_path = self.root / "queue.jsonl"
+        self.state_path = self.root / "state.json"
+        self.state = self._load_state()
+
+    def _load_state(self) -> dict:
+        state = {}
+        if self.state_path.exists():
+            state = json.loads(self.state_path.read_text())
+        state.setdefault("seen", {})
+        state.setdefault("http_cache", {})
+        return state
+
+    @property
+    def http_cache(self) -> dict:
+        """Per-URL ``{"etag": ..., "modified": ...}`` validators for conditional requests."""
+        return self.state["http_cache"]
+
+    def is_new(self, paper: Paper) -> bool:
+        return paper.uid not in self.state["seen"]
+
+    def mark_seen(self, paper: Paper):
+        self.state["seen"][paper.uid] = datetime.now().strftime("%Y-%m-%d")
+
+    @contextmanager
+    def _queue_lock(self):
+        """Hold ``queue.lock`` exclusively (across processes) while touching the queue."""
+        with open(self.root / "queue.lock", "a") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def enqueue(self, paper: Paper):
+        with self._queue_lock(), open(self.queue_path, "ab") as f:
+            f.writelines(dumps_jsonl([paper]))
+
+    def pending(self) -> int:
+        if not self.queue_path.exists():
+            return 0
+        with open(self.queue_path, "rb") as f:
+            return sum(1 for line in f if line.strip())
+
+    def take_ready(self, limit: Optional[int] = None, since: Optional[str] = None) -> list[Paper]:
+        """Move the top ``limit`` queued papers (by :func:`rank_key`) into ``archive/``.
+
+        Papers dated before ``since`` (YYYY-MM-DD, normally the run's lookback
+        cutoff) are archived as ``expired-*.jsonl`` without being ranked.
+        Papers beyond ``limit`` stay queued for the next run.
+        """
+        archive_dir = self.root / "archive"
+        stamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        with self._queue_lock():
+            if not self.queue_path.exists():
+                return []
+            papers = list(read_papers_jsonl(self.queue_path))
+            archive_dir.mkdir(exist_ok=True)
+            expired = []
+            if since:
+                # Undated papers can't be aged out; they stay eligible
+                expired = [p for p in papers if p.date and p.date[:10] < since]
+                papers = [p for p in papers if not p.date or p.date[:10] >= since]
+            if expired:
+                (archive_dir / f"expired-{stamp}.jsonl").write_bytes(b"".join(dumps_jsonl(expired)))
+
+            if limit is None or len(papers) <= limit:
+                selected, rest = papers, []
+            else:
+                # sorted() is stable, so equally ranked papers keep arrival order
+                order = sorted(range(len(papers)), key=lambda i: rank_key(papers[i]), reverse=True)
+                selected = [papers[i] for i in order[:limit]]
+                keep = set(order[limit:])
+                rest = [p for i, p in enumerate(papers) if i in keep]
+
+            # Archive first: a crash in between leaves duplicates, never losses
+            if selected:
+                (archive_dir / f"queue-{stamp}.jsonl").write_bytes(b"".join(dumps_jsonl(selected)))
+            tmp = self.queue_path.with_suffix(".jsonl.tmp")
+            tmp.write_bytes(b"".join(dumps_jsonl(rest)))
+            os.replace(tmp, self.queue_path)
+        return selected
+
+    @property
+    def last_poll(self) -> Optional[datetime]:
+        """When the last complete watch poll finished, or None if none has."""
+        last = self.state.get("last_poll")
+        return datetime.fromisoformat(last) if last else None
+
+    def record_poll(self, window_days: int):
+        """Note a complete poll covering the last ``window_days`` days."""
+        now = datetime.now()
+        last = self.last_poll
+        # A gap longer than the poll window breaks continuous coverage
+        if last is None or now - last > timedelta(days=window_days):
+            self.state["covered_since"] = (now - timedelta(days=window_days)).strftime("%Y-%m-%d")
+        self.state["last_poll"] = now.isoformat(timespec="seconds")
+
+    def coverage_gap(self, days_lookback: int, stale_after: timedelta) -> Optional[tuple[str, str]]:
+        """Span of the last ``days_lookback`` days not covered by watch polls, or None.
+
+        Dates before the watcher's continuous coverage began, and dates after
+        its last poll if that is older than ``stale_after``, are merged into
+        one inclusive ``(start, end)`` span.
+        """
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
+        window_start = (now - timedelta(days=days_lookback)).strftime("%Y-%m-%d")
+        last = self.last_poll
+        if last is None:
+            return window_start, today
+
+        starts, ends = [], []
+        covered_since = self.state.get("covered_since", today)
+        if covered_since > window_start:
+            starts.append(window_start)
+            ends.append(covered_since)
+        if now - last > stale_after:
+            starts.append(last.strftime("%Y-%m-%d"))
+            ends.append(today)
+        if not starts:
+            return None
+        return min(starts), max(ends)
+
+    def prune_seen(self, max_age_days: int):
+        """Forget seen uids older than ``max_age_days`` so the state stays bounded."""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).strftime("%Y-%m-%d")
+        self.state["seen"] = {uid: d for uid, d in self.state["seen"].items() if d >= cutoff}
+
+    def save(self):
+        tmp = self.state_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.state, separators=(",", ":")))
+        os.replace(tmp, self.state_path)
+
+
+def store_path(cfg: dict) -> Path:
+    """``cfg["paper_store"]``, or ``store/`` next to the shared ``pdfs/`` folder."""
+    if cfg.get("paper_store"):
+        return Path(cfg["paper_store"]).expanduser()
+    return Path(cfg.get("output_dir", "output")).parent / "store"
@@ -0,0 +1,110 @@
+"""
+Watch mode
+==========
+Long-running poller that keeps the paper store's ready queue warm: every
+``watch_interval_minutes`` it polls the configured sources over a short
+window (``watch_days_lookback``), skips papers already seen, filters, and
+downloads PDFs for the rest. RSS feeds are fetched with conditional requests
+(ETag / Last-Modified), so unchanged feeds cost a 304. The weekly run then
+picks the queue up instead of fetching a whole week at once.
+"""
+
+import logging
+import time
+from pathlib import Path
+
+from .download import download_pdf
+from .filters import compile_exclusion_rules, exclusion_field, genomics_matches
+from .pipeline import pdf_report, setup_logging
+from .sources import iter_sources
+from .store import PaperStore, store_path
+
+
+def poll_once(cfg: dict, store: PaperStore, pdf_dir: Path, logger: logging.Logger) -> int:
+    """Run one poll cycle; returns the number of papers added to the queue.
+
+    A paper is marked seen only once it has been queued or has failed a
+    filter, and a feed's validators are only committed after all of its
+    entries were read, so an interrupted cycle is picked up by the next one.
+    A cycle in which any source request failed is not recorded as a poll, so
+    the weekly run still sees the dates as uncovered and fetches them.
+    """
+    errors = []
+    poll_cfg = {
+        **cfg,
+        "days_lookback": cfg.get("watch_days_lookback", 2),
+        "http_cache": store.http_cache,
+        "fetch_errors": errors,
+    }
+    rules = compile_exclusion_rules(cfg.get("exclusion_rules"))
+    timeout = cfg.get("pdf_timeout", 30)
+
+    added = 0
+    try:
+        for paper in iter_sources(poll_cfg, logger):
+            if not store.is_new(paper):
+                continue
+            field = exclusion_field(paper, rules)
+            matched = () if field else genomics_matches(paper, cfg["genomics_keywords"])
+            if not matched:
+                logger.debug(f"  Skipped ({field or 'not genomics'}): {paper.title[:60]}...")
+                store.mark_seen(paper)
+                continue
+            paper.matched_keywords = matched
+            if cfg.get("download_pdfs", True):
+                logger.info(f"  {paper.title[:60]}...")
+                pdf_path = download_pdf(paper, pdf_dir, timeout, logger)
+                paper.pdf_path = pdf_path or ""
+                paper.review_mode = "pdf" if pdf_path else "abstract"
+            else:
+                paper.review_mode = "abstract"
+            store.enqueue(paper)
+            store.mark_seen(paper)
+            added += 1
+        if errors:
+            logger.warning(f"  {len(errors)} source request(s) failed; not counting this poll as coverage")
+        else:
+            store.record_poll(poll_cfg["days_lookback"])
+    finally:
+        # Persist seen uids and validators even if the cycle is interrupted
+        store.prune_seen(cfg.get("watch_seen_days", 90))
+        store.save()
+    return added
+
+
+def run_watch(cfg: dict, once: bool = False):
+    """Poll sources on a schedule, keeping the paper store's ready queue warm."""
+    logger = setup_logging("fetch-papers-watch")
+    output_dir = Path(cfg.get("output_dir", "output"))
+    pdf_dir = output_dir.parent / "pdfs"
+    pdf_dir.mkdir(parents=True, exist_ok=True)
+    store = PaperStore(store_path(cfg))
+    interval = cfg.get("watch_interval_minutes", 60) * 60
+
+    logger.info("=" * 60)
+    logger.info("WATCH — Genomics Paper Collector")
+    logger.info(f"  Store: {store.root}")
+    logger.info(f"  Interval: {interval // 60} min")
+    logger.info("=" * 60)
+
+    # PDF source timing, cumulative since the watcher started
+    with pdf_report() as report:
+        try:
+            while True:
+                started = time.monotonic()
+                logger.info("\nPolling sources...")
+                try:
+                    added = poll_once(cfg, store, pdf_dir, logger)
+                    logger.info(f"  Queued {added} new papers ({store.pending()} ready)")
+                    if added:
+                        report.log(logger)
+                except Exception as e:
+                    # Keep the daemon alive across transient failures
+                    logger.error(f"  Poll failed: {e}")
+                if once:
+                    break
+                time.sleep(max(0, interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            # poll_once has already saved the store's state
+            logger.info("Stopping watch.")
+            report.log(logger)